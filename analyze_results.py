@@ -7,223 +7,485 @@ and detailed analysis reports.
 """
 
 import os
+import re
 import sys
-import glob
 import json
+import mmap
+import csv
 import argparse
-import matplotlib.pyplot as plt
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache, partial
 import numpy as np
 from pathlib import Path
 from datetime import datetime
-import pandas as pd
 
-def parse_results_file(file_path):
+# Below this many files the process pool startup costs more than it saves
+PARALLEL_PARSE_THRESHOLD = 32
+
+# Above this many files, results files are read through memory maps
+MMAP_PARSE_THRESHOLD = 256
+
+# Above this many values reduce_stats() JIT-compiles its loop with numba,
+# when installed; below it the import and compile cost outweighs the win
+NUMBA_REDUCE_THRESHOLD = 1_000_000
+
+# Parsed results are cached here (inside the output directory) between runs
+MANIFEST_NAME = 'results_manifest.json'
+
+# Above this many rows the CSV export goes through pyarrow when available
+ARROW_CSV_THRESHOLD = 1000
+
+# Figure reused by generate_throughput_graph() across calls
+_throughput_figure = None
+
+# Converters for known numeric keys; everything else is kept as a string
+CONVERTERS = {
+    'avg_throughput': float,
+    'burst_size': int,
+    'test_duration': int,
+}
+
+# One "key: value" pair per line; whitespace around key and value is dropped
+RESULT_LINE_PATTERN = re.compile(rb'^[ \t]*([^:\r\n]+?)[ \t]*:[ \t]*(.*?)[ \t\r]*$',
+                                 re.M)
+
+def tokenize_mapped_file(file_path):
+    """Tokenize a results file through a read-only memory map."""
+    fd = os.open(file_path, os.O_RDONLY)
+    try:
+        size = os.fstat(fd).st_size
+        if not size:
+            return []
+        with mmap.mmap(fd, size, access=mmap.ACCESS_READ) as mm:
+            return RESULT_LINE_PATTERN.findall(mm)
+    finally:
+        os.close(fd)
+
+def parse_results_file(file_path, use_mmap=False):
     """Parse a results file and extract metrics."""
     results = {}
     
     try:
-        with open(file_path, 'r') as f:
-            for line in f:
-                line = line.strip()
-                if ':' in line:
-                    key, value = line.split(':', 1)
-                    if key == 'avg_throughput':
-                        results[key] = float(value)
-                    elif key == 'burst_size':
-                        results[key] = int(value)
-                    elif key == 'test_duration':
-                        results[key] = int(value)
-                    else:
-                        results[key] = value
+        if use_mmap:
+            pairs = tokenize_mapped_file(file_path)
+        else:
+            pairs = RESULT_LINE_PATTERN.findall(Path(file_path).read_bytes())
+        for key, value in pairs:
+            key = key.decode()
+            results[key] = CONVERTERS.get(key, bytes.decode)(value)
     except Exception as e:
         print(f"Error parsing {file_path}: {e}")
         return None
     
     return results
 
-def load_benchmark_data(results_dir):
-    """Load all benchmark data from results directory."""
-    data = []
+def parse_results_files(file_paths):
+    """Parse several results files, in parallel when there are many."""
+    parse = partial(parse_results_file,
+                    use_mmap=len(file_paths) > MMAP_PARSE_THRESHOLD)
+    if len(file_paths) > PARALLEL_PARSE_THRESHOLD:
+        with ProcessPoolExecutor() as executor:
+            return list(executor.map(parse, file_paths, chunksize=16))
+    return [parse(file_path) for file_path in file_paths]
+
+def load_manifest(manifest_path):
+    """Load the parsed-results cache, or an empty one if it is unusable."""
+    try:
+        manifest = json.loads(Path(manifest_path).read_text())
+    except (OSError, ValueError):
+        return {}
+    return manifest if isinstance(manifest, dict) else {}
+
+def parse_results_cached(entries, manifest_path):
+    """Parse results files, reusing entries cached in ``manifest_path``.
+    
+    Files are remembered by modification time and size, so only new or
+    changed files are parsed; the manifest is rewritten when it changes.
+    """
+    cached = load_manifest(manifest_path)
+    manifest = {}
+    results = [None] * len(entries)
+    stale = []
+    
+    for i, dir_entry in enumerate(entries):
+        st = dir_entry.stat()
+        key = os.path.abspath(dir_entry.path)
+        stamp = [st.st_mtime_ns, st.st_size]
+        cached_entry = cached.get(key)
+        if isinstance(cached_entry, dict) and cached_entry.get('stamp') == stamp:
+            results[i] = cached_entry['result']
+            manifest[key] = cached_entry
+        else:
+            stale.append((i, key, stamp))
+    
+    parsed = parse_results_files([entries[i].path for i, _, _ in stale])
+    for (i, key, stamp), result in zip(stale, parsed):
+        results[i] = result
+        # Failures are not cached so their errors are reported on every run
+        if result is not None:
+            manifest[key] = {'stamp': stamp, 'result': result}
+    
+    if manifest != cached:
+        try:
+            Path(manifest_path).write_text(json.dumps(manifest))
+        except OSError as e:
+            print(f"Error writing cache {manifest_path}: {e}")
+    
+    return results
+
+def load_benchmark_data(results_dir, cache_dir=None):
+    """Load all benchmark data from results directory into a DataFrame.
+    
+    When ``cache_dir`` is given, parsed files are cached there between
+    runs (see parse_results_cached()).
+    """
+    import pandas as pd
     
     # Find all results files
-    pattern = os.path.join(results_dir, "results_burst_*.txt")
-    result_files = glob.glob(pattern)
+    with os.scandir(results_dir) as it:
+        entries = [entry for entry in it
+                   if entry.name.startswith('results_burst_')
+                   and entry.name.endswith('.txt')
+                   and entry.is_file()]
+    
+    if cache_dir:
+        results = parse_results_cached(entries,
+                                       os.path.join(cache_dir, MANIFEST_NAME))
+    else:
+        results = parse_results_files([entry.path for entry in entries])
     
-    for file_path in result_files:
-        result = parse_results_file(file_path)
-        if result and 'burst_size' in result and 'avg_throughput' in result:
-            data.append(result)
+    records = [result for result in results
+               if result and 'burst_size' in result and 'avg_throughput' in result]
+    
+    if not records:
+        return pd.DataFrame()
     
     # Sort by burst size
-    data.sort(key=lambda x: x['burst_size'])
-    return data
+    return (pd.DataFrame.from_records(records)
+            .sort_values('burst_size', kind='stable')
+            .reset_index(drop=True))
+
+def benchmark_arrays(data):
+    """Return the burst size and throughput columns as NumPy arrays."""
+    return (data['burst_size'].to_numpy(),
+            data['avg_throughput'].to_numpy(dtype=np.float64))
+
+def top_k_indices(values, k):
+    """Return indices of the ``k`` largest values, largest first.
+    
+    Ties keep their original order, like a stable reverse sort.
+    """
+    return np.argsort(-values, kind='stable')[:k]
+
+def line_segments(x, y, color):
+    """Build a single LineCollection joining consecutive (x, y) points."""
+    from matplotlib.collections import LineCollection
+    
+    points = np.column_stack([x, y])
+    segments = np.stack([points[:-1], points[1:]], axis=1)
+    return LineCollection(segments, colors=color, linewidths=2,
+                          rasterized=True)
+
+def import_pyplot(interactive):
+    """Import and configure pyplot.
+    
+    Matplotlib is only loaded once a graph is actually drawn, which keeps
+    --no-graphs and --csv-only runs fast to start. Unless ``interactive``
+    is set, the non-interactive Agg backend is selected.
+    """
+    import matplotlib
+    if not interactive:
+        matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+    
+    # Favour drawing speed over exact path fidelity
+    matplotlib.style.use('fast')
+    matplotlib.rcParams['path.simplify'] = True
+    matplotlib.rcParams['path.simplify_threshold'] = 1.0
+    matplotlib.rcParams['agg.path.chunksize'] = 10000
+    return plt
+
+def get_throughput_figure():
+    """Return an empty figure for the throughput graph.
+    
+    The figure from the previous call is cleared and reused while it is
+    still open, so repeated runs don't reallocate the canvas.
+    """
+    import matplotlib.pyplot as plt
+    
+    global _throughput_figure
+    if _throughput_figure is None or not plt.fignum_exists(_throughput_figure.number):
+        _throughput_figure = plt.figure(figsize=(12, 8))
+    else:
+        _throughput_figure.clear()
+    return _throughput_figure
 
-def generate_throughput_graph(data, output_dir):
-    """Generate throughput vs burst size graph."""
-    if not data:
+def generate_throughput_graph(data, output_dir, dpi=150, show=False, pdf=False):
+    """Generate throughput vs burst size graph.
+    
+    The figure is only displayed interactively when ``show`` is set, and
+    a PDF copy (a second full render) is only written when ``pdf`` is set.
+    """
+    if data.empty:
         print("No data available for graphing")
         return
     
-    burst_sizes = [d['burst_size'] for d in data]
-    throughputs = [d['avg_throughput'] for d in data]
+    burst_sizes, throughputs = benchmark_arrays(data)
+    _, max_throughput, _, min_idx, max_idx = reduce_stats(throughputs)
+    
+    # Only label the best and worst points; one text artist per point
+    # dominates render time on large sweeps
+    annotated = np.unique([max_idx, min_idx])
     
-    plt.figure(figsize=(12, 8))
+    plt = import_pyplot(interactive=show)
+    fig = get_throughput_figure()
+    ax1 = fig.add_subplot(2, 1, 1)
+    ax2 = fig.add_subplot(2, 1, 2)
     
     # Main plot
-    plt.subplot(2, 1, 1)
-    plt.plot(burst_sizes, throughputs, 'bo-', linewidth=2, markersize=8)
-    plt.xlabel('Burst Size')
-    plt.ylabel('Throughput (packets/sec)')
-    plt.title('DPDK Packet Rate vs Burst Size')
-    plt.grid(True, alpha=0.3)
-    plt.xscale('log', base=2)
+    ax1.add_collection(line_segments(burst_sizes, throughputs, 'b'))
+    ax1.scatter(burst_sizes, throughputs, c='b', s=64, rasterized=True)
+    ax1.set_xlabel('Burst Size')
+    ax1.set_ylabel('Throughput (packets/sec)')
+    ax1.set_title('DPDK Packet Rate vs Burst Size')
+    ax1.grid(True, alpha=0.3)
+    ax1.set_xscale('log', base=2)
     
     # Annotate data points
-    for i, (bs, tp) in enumerate(zip(burst_sizes, throughputs)):
-        plt.annotate(f'{tp:.0f}', (bs, tp), textcoords="offset points", 
-                    xytext=(0,10), ha='center')
+    for i in annotated:
+        ax1.annotate(f'{throughputs[i]:.0f}', (burst_sizes[i], throughputs[i]),
+                     textcoords="offset points", xytext=(0,10), ha='center')
     
     # Efficiency plot (normalized to peak)
-    plt.subplot(2, 1, 2)
-    max_throughput = max(throughputs)
-    efficiency = [tp / max_throughput * 100 for tp in throughputs]
-    
-    plt.plot(burst_sizes, efficiency, 'ro-', linewidth=2, markersize=8)
-    plt.xlabel('Burst Size')
-    plt.ylabel('Efficiency (%)')
-    plt.title('Relative Efficiency vs Burst Size')
-    plt.grid(True, alpha=0.3)
-    plt.xscale('log', base=2)
-    plt.ylim(0, 105)
+    efficiency = throughputs / max_throughput * 100
+    
+    ax2.add_collection(line_segments(burst_sizes, efficiency, 'r'))
+    ax2.scatter(burst_sizes, efficiency, c='r', s=64, rasterized=True)
+    ax2.set_xlabel('Burst Size')
+    ax2.set_ylabel('Efficiency (%)')
+    ax2.set_title('Relative Efficiency vs Burst Size')
+    ax2.grid(True, alpha=0.3)
+    ax2.set_xscale('log', base=2)
+    ax2.set_ylim(0, 105)
     
     # Annotate efficiency points
-    for i, (bs, eff) in enumerate(zip(burst_sizes, efficiency)):
-        plt.annotate(f'{eff:.1f}%', (bs, eff), textcoords="offset points", 
-                    xytext=(0,10), ha='center')
+    for i in annotated:
+        ax2.annotate(f'{efficiency[i]:.1f}%', (burst_sizes[i], efficiency[i]),
+                     textcoords="offset points", xytext=(0,10), ha='center')
     
-    plt.tight_layout()
+    fig.tight_layout()
     
     # Save graph
     graph_path = os.path.join(output_dir, 'throughput_analysis.png')
-    plt.savefig(graph_path, dpi=300, bbox_inches='tight')
+    fig.savefig(graph_path, dpi=dpi, bbox_inches='tight')
     print(f"Throughput graph saved to: {graph_path}")
     
-    # Also save as PDF
-    pdf_path = os.path.join(output_dir, 'throughput_analysis.pdf')
-    plt.savefig(pdf_path, bbox_inches='tight')
-    print(f"PDF graph saved to: {pdf_path}")
+    if pdf:
+        pdf_path = os.path.join(output_dir, 'throughput_analysis.pdf')
+        with plt.rc_context({'pdf.compression': 9}):
+            fig.savefig(pdf_path, dpi=dpi, bbox_inches='tight')
+        print(f"PDF graph saved to: {pdf_path}")
     
-    plt.show()
+    if show:
+        plt.show()
+
+def reduce_stats(values):
+    """Compute min, max, mean and the first argmin/argmax.
+    
+    Returns ``(min, max, mean, min_idx, max_idx)``. Very large arrays go
+    through a single-pass numba kernel when numba is installed.
+    """
+    if len(values) > NUMBA_REDUCE_THRESHOLD:
+        kernel = get_reduce_kernel()
+        if kernel is not None:
+            return kernel(values)
+    
+    min_idx = int(values.argmin())
+    max_idx = int(values.argmax())
+    return values[min_idx], values[max_idx], values.mean(), min_idx, max_idx
+
+@lru_cache(maxsize=None)
+def get_reduce_kernel():
+    """JIT-compile reduce_stats_loop(), or return None without numba."""
+    try:
+        from numba import njit
+    except ImportError:
+        return None
+    return njit(cache=True)(reduce_stats_loop)
+
+def reduce_stats_loop(values):
+    """Single-pass loop behind reduce_stats(), compiled by numba."""
+    min_val = values[0]
+    max_val = values[0]
+    min_idx = 0
+    max_idx = 0
+    total = 0.0
+    for i in range(values.shape[0]):
+        v = values[i]
+        total += v
+        if v < min_val:
+            min_val = v
+            min_idx = i
+        if v > max_val:
+            max_val = v
+            max_idx = i
+    return min_val, max_val, total / values.shape[0], min_idx, max_idx
+
+def classify_results(burst_sizes, rel_perfs, best_burst, worst_burst):
+    """Return the notes column of the detailed results table."""
+    notes = np.full(len(rel_perfs), '', dtype=object)
+    notes[burst_sizes == best_burst] += 'BEST '
+    notes[burst_sizes == worst_burst] += 'WORST '
+    notes[rel_perfs > 95] += 'EXCELLENT '
+    notes[(rel_perfs > 80) & (rel_perfs <= 95)] += 'GOOD '
+    notes[rel_perfs < 50] += 'POOR '
+    return notes
 
 def generate_detailed_report(data, output_dir):
     """Generate detailed analysis report."""
-    if not data:
+    if data.empty:
         print("No data available for analysis")
         return
     
     report_path = os.path.join(output_dir, 'detailed_analysis.txt')
     
-    burst_sizes = [d['burst_size'] for d in data]
-    throughputs = [d['avg_throughput'] for d in data]
+    burst_sizes, throughputs = benchmark_arrays(data)
     
     # Calculate statistics
-    max_throughput = max(throughputs)
-    min_throughput = min(throughputs)
-    avg_throughput = np.mean(throughputs)
+    (min_throughput, max_throughput, avg_throughput,
+     worst_idx, best_idx) = reduce_stats(throughputs)
     
-    best_burst = burst_sizes[throughputs.index(max_throughput)]
-    worst_burst = burst_sizes[throughputs.index(min_throughput)]
+    best_burst = burst_sizes[best_idx]
+    worst_burst = burst_sizes[worst_idx]
     
     # Calculate improvement ratios
     improvement_from_min = max_throughput / min_throughput
     
-    with open(report_path, 'w') as f:
-        f.write("=== DETAILED BENCHMARK ANALYSIS ===\n")
-        f.write(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-        f.write(f"Total test configurations: {len(data)}\n\n")
-        
-        f.write("=== PERFORMANCE SUMMARY ===\n")
-        f.write(f"Maximum throughput: {max_throughput:,.0f} packets/sec (burst size {best_burst})\n")
-        f.write(f"Minimum throughput: {min_throughput:,.0f} packets/sec (burst size {worst_burst})\n")
-        f.write(f"Average throughput: {avg_throughput:,.0f} packets/sec\n")
-        f.write(f"Performance range: {improvement_from_min:.2f}x improvement from worst to best\n\n")
-        
-        f.write("=== DETAILED RESULTS ===\n")
-        f.write(f"{'Burst Size':<12} {'Throughput':<15} {'Relative Perf':<15} {'Notes':<20}\n")
-        f.write(f"{'-'*12:<12} {'-'*15:<15} {'-'*15:<15} {'-'*20:<20}\n")
-        
-        for d in data:
-            bs = d['burst_size']
-            tp = d['avg_throughput']
-            rel_perf = tp / max_throughput * 100
-            
-            notes = ""
-            if bs == best_burst:
-                notes += "BEST "
-            if bs == worst_burst:
-                notes += "WORST "
-            if rel_perf > 95:
-                notes += "EXCELLENT "
-            elif rel_perf > 80:
-                notes += "GOOD "
-            elif rel_perf < 50:
-                notes += "POOR "
-            
-            f.write(f"{bs:<12} {tp:,.0f}{'':>7} {rel_perf:>6.1f}%{'':>7} {notes:<20}\n")
-        
-        f.write("\n=== RECOMMENDATIONS ===\n")
-        
-        # Find top 3 performers
-        sorted_data = sorted(data, key=lambda x: x['avg_throughput'], reverse=True)
-        top_3 = sorted_data[:3]
-        
-        f.write("Top 3 performing burst sizes:\n")
-        for i, d in enumerate(top_3, 1):
-            f.write(f"  {i}. Burst size {d['burst_size']}: {d['avg_throughput']:,.0f} packets/sec\n")
-        
-        f.write("\nOptimal burst size selection:\n")
-        if best_burst <= 32:
-            f.write("- Low latency applications: Consider burst sizes 1-16\n")
-            f.write("- Balanced applications: Use burst size 32 or lower\n")
-        else:
-            f.write("- High throughput applications: Use larger burst sizes (64-256)\n")
-            f.write("- Low latency applications: Consider smaller burst sizes (1-32)\n")
-        
-        f.write(f"- Best overall performance: Burst size {best_burst}\n")
-        
-        # Efficiency analysis
-        f.write("\n=== EFFICIENCY ANALYSIS ===\n")
-        efficient_configs = [d for d in data if d['avg_throughput'] / max_throughput > 0.9]
-        f.write(f"Configurations achieving >90% efficiency: {len(efficient_configs)}\n")
-        for d in efficient_configs:
-            eff = d['avg_throughput'] / max_throughput * 100
-            f.write(f"  - Burst size {d['burst_size']}: {eff:.1f}% efficiency\n")
+    # Build the report in memory
+    parts = []
+    parts.append("=== DETAILED BENCHMARK ANALYSIS ===\n")
+    parts.append(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+    parts.append(f"Total test configurations: {len(data)}\n\n")
+    
+    parts.append("=== PERFORMANCE SUMMARY ===\n")
+    parts.append(f"Maximum throughput: {max_throughput:,.0f} packets/sec (burst size {best_burst})\n")
+    parts.append(f"Minimum throughput: {min_throughput:,.0f} packets/sec (burst size {worst_burst})\n")
+    parts.append(f"Average throughput: {avg_throughput:,.0f} packets/sec\n")
+    parts.append(f"Performance range: {improvement_from_min:.2f}x improvement from worst to best\n\n")
+    
+    parts.append("=== DETAILED RESULTS ===\n")
+    parts.append(f"{'Burst Size':<12} {'Throughput':<15} {'Relative Perf':<15} {'Notes':<20}\n")
+    parts.append(f"{'-'*12:<12} {'-'*15:<15} {'-'*15:<15} {'-'*20:<20}\n")
+    
+    rel_perfs = throughputs / max_throughput * 100
+    notes = classify_results(burst_sizes, rel_perfs, best_burst, worst_burst)
+    parts.extend(
+        f"{bs:<12} {tp:,.0f}{'':>7} {rel_perf:>6.1f}%{'':>7} {note:<20}\n"
+        for bs, tp, rel_perf, note in zip(burst_sizes, throughputs, rel_perfs, notes))
+    
+    parts.append("\n=== RECOMMENDATIONS ===\n")
+    
+    # Find top 3 performers
+    top_3 = top_k_indices(throughputs, 3)
+    
+    parts.append("Top 3 performing burst sizes:\n")
+    parts.extend(
+        f"  {i}. Burst size {burst_sizes[idx]}: {throughputs[idx]:,.0f} packets/sec\n"
+        for i, idx in enumerate(top_3, 1))
+    
+    parts.append("\nOptimal burst size selection:\n")
+    if best_burst <= 32:
+        parts.append("- Low latency applications: Consider burst sizes 1-16\n")
+        parts.append("- Balanced applications: Use burst size 32 or lower\n")
+    else:
+        parts.append("- High throughput applications: Use larger burst sizes (64-256)\n")
+        parts.append("- Low latency applications: Consider smaller burst sizes (1-32)\n")
+    
+    parts.append(f"- Best overall performance: Burst size {best_burst}\n")
+    
+    # Efficiency analysis
+    parts.append("\n=== EFFICIENCY ANALYSIS ===\n")
+    efficient = throughputs / max_throughput > 0.9
+    parts.append(f"Configurations achieving >90% efficiency: {efficient.sum()}\n")
+    parts.extend(
+        f"  - Burst size {bs}: {eff:.1f}% efficiency\n"
+        for bs, eff in zip(burst_sizes[efficient], rel_perfs[efficient]))
+    
+    # Write the whole report in one go
+    Path(report_path).write_text(''.join(parts))
     
     print(f"Detailed analysis saved to: {report_path}")
 
+def csv_column(values):
+    """Convert a column to Python scalars, leaving missing values blank."""
+    import pandas as pd
+    
+    missing = pd.isna(values)
+    values = np.asarray(values).tolist()
+    for i in np.flatnonzero(missing):
+        values[i] = ''
+    return values
+
+def write_csv_arrow(csv_path, columns, column_names):
+    """Write columns with pyarrow's CSV writer.
+    
+    The output matches the csv.writer path byte for byte: the header is
+    written unquoted, floats are pre-formatted by NumPy the way Python
+    prints them ("81.0" where Arrow would write "81"), and nothing is
+    quoted. Returns False if pyarrow is missing or too old, or a value
+    would need quoting; the caller then writes the file with csv.writer.
+    """
+    try:
+        import pyarrow as pa
+        import pyarrow.csv as pv
+    except ImportError:
+        return False
+    
+    arrays = {}
+    for name in column_names:
+        values = np.asarray(columns[name])
+        if values.dtype.kind == 'f':
+            arrays[name] = pa.array(values.astype(str), mask=np.isnan(values))
+        else:
+            arrays[name] = pa.array(columns[name], from_pandas=True)
+    table = pa.table(arrays)
+    
+    try:
+        write_options = pv.WriteOptions(include_header=False,
+                                        quoting_style='none')
+        with open(csv_path, 'wb') as f:
+            f.write((','.join(column_names) + '\n').encode())
+            pv.write_csv(table, f, write_options=write_options)
+    except (TypeError, pa.ArrowInvalid):
+        return False
+    return True
+
 def generate_csv_export(data, output_dir):
     """Export data to CSV for further analysis."""
-    if not data:
+    if data.empty:
         return
     
     csv_path = os.path.join(output_dir, 'benchmark_data.csv')
     
-    # Create DataFrame
-    df = pd.DataFrame(data)
-    
-    # Add calculated columns
-    if 'avg_throughput' in df.columns:
-        max_tp = df['avg_throughput'].max()
-        df['efficiency_percent'] = (df['avg_throughput'] / max_tp * 100).round(1)
-        df['throughput_mpps'] = (df['avg_throughput'] / 1_000_000).round(3)
+    # Calculated columns, computed straight from the throughput array
+    _, throughputs = benchmark_arrays(data)
+    columns = dict(data.items())
+    columns['throughput_mpps'] = np.round(throughputs / 1_000_000, 3)
+    columns['efficiency_percent'] = np.round(
+        throughputs * (100.0 / throughputs.max()), 1)
     
     # Reorder columns
     column_order = ['burst_size', 'avg_throughput', 'throughput_mpps', 
                    'efficiency_percent', 'test_duration', 'timestamp']
-    available_columns = [col for col in column_order if col in df.columns]
-    df = df[available_columns]
+    available_columns = [col for col in column_order if col in columns]
+    
+    if (len(data) <= ARROW_CSV_THRESHOLD
+            or not write_csv_arrow(csv_path, columns, available_columns)):
+        with open(csv_path, 'w', newline='') as f:
+            writer = csv.writer(f, lineterminator='\n')
+            writer.writerow(available_columns)
+            writer.writerows(zip(*(csv_column(columns[col]) for col in available_columns)))
     
-    df.to_csv(csv_path, index=False)
     print(f"CSV data exported to: {csv_path}")
 
 def main():
@@ -237,9 +499,21 @@ def main():
                        help='Skip detailed report generation')
     parser.add_argument('--csv-only', action='store_true',
                        help='Only generate CSV export')
+    parser.add_argument('--batch', action='store_true',
+                       help='Never display graphs interactively')
+    parser.add_argument('--dpi', type=int, default=150,
+                       help='Resolution of the PNG graph (default: 150)')
+    parser.add_argument('--pdf', action='store_true',
+                       help='Also save the graph as PDF')
+    parser.add_argument('--no-cache', action='store_true',
+                       help='Reparse every results file instead of using '
+                            'the cached manifest')
     
     args = parser.parse_args()
     
+    # Only bring up a GUI when someone is watching
+    show_graphs = sys.stdout.isatty() and not args.batch
+    
     # Validate input directory
     if not os.path.exists(args.results_dir):
         print(f"Error: Results directory '{args.results_dir}' not found")
@@ -257,9 +531,10 @@ def main():
     print(f"Output directory: {output_dir}")
     
     # Load data
-    data = load_benchmark_data(args.results_dir)
+    data = load_benchmark_data(args.results_dir,
+                               cache_dir=None if args.no_cache else output_dir)
     
-    if not data:
+    if data.empty:
         print("No valid benchmark data found!")
         sys.exit(1)
     
@@ -271,7 +546,8 @@ def main():
     else:
         if not args.no_graphs:
             try:
-                generate_throughput_graph(data, output_dir)
+                generate_throughput_graph(data, output_dir, dpi=args.dpi,
+                                          show=show_graphs, pdf=args.pdf)
             except Exception as e:
                 print(f"Error generating graphs: {e}")
         